@@ -0,0 +1,156 @@
+'''
+Business: Delete several templates in one transaction by IDs and/or age
+Args: event - dict with httpMethod, body containing templateIds and/or olderThanDays
+      context - object with attributes: request_id, function_name
+Returns: HTTP response with per-template deletion results
+'''
+
+import json
+import os
+import psycopg2
+from typing import Dict, Any, List
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    method: str = event.get('httpMethod', 'DELETE')
+
+    if method == 'OPTIONS':
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Allow-Methods': 'DELETE, OPTIONS',
+                'Access-Control-Allow-Headers': 'Content-Type',
+                'Access-Control-Max-Age': '86400'
+            },
+            'body': ''
+        }
+
+    if method != 'DELETE':
+        return {
+            'statusCode': 405,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({'error': 'Method not allowed'})
+        }
+
+    body_str = event.get('body', '{}')
+    try:
+        body = json.loads(body_str) if body_str else {}
+    except (TypeError, ValueError):
+        body = None
+    if not isinstance(body, dict):
+        return {
+            'statusCode': 400,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({'error': 'Request body must be a JSON object'})
+        }
+
+    template_ids = body.get('templateIds')
+    older_than_days = body.get('olderThanDays')
+
+    if template_ids is None:
+        template_ids = []
+    elif not isinstance(template_ids, list) or not all(type(item) is int for item in template_ids):
+        return {
+            'statusCode': 400,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({'error': 'templateIds must be a list of integers'})
+        }
+
+    if older_than_days is not None and (type(older_than_days) is not int or older_than_days < 1):
+        return {
+            'statusCode': 400,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({'error': 'olderThanDays must be a positive integer'})
+        }
+
+    if not template_ids and older_than_days is None:
+        return {
+            'statusCode': 400,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({'error': 'templateIds or olderThanDays is required'})
+        }
+
+    dsn = os.environ.get('DATABASE_URL')
+    if not dsn:
+        return {
+            'statusCode': 500,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({'error': 'DATABASE_URL not configured'})
+        }
+
+    conditions: List[str] = []
+    params: List[Any] = []
+    if template_ids:
+        conditions.append("id = ANY(%s)")
+        params.append(template_ids)
+    if older_than_days is not None:
+        conditions.append("created_at < CURRENT_TIMESTAMP - %s * INTERVAL '1 day'")
+        params.append(older_than_days)
+
+    conn = psycopg2.connect(dsn)
+    cursor = conn.cursor()
+
+    try:
+        existing_ids = set()
+        if template_ids:
+            cursor.execute("SELECT id FROM templates WHERE id = ANY(%s) FOR UPDATE", (template_ids,))
+            existing_ids = {row[0] for row in cursor.fetchall()}
+
+        query = f"DELETE FROM templates WHERE {' AND '.join(conditions)} RETURNING id"
+        cursor.execute(query, params)
+        deleted_ids = sorted(row[0] for row in cursor.fetchall())
+
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        return {
+            'statusCode': 500,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({'error': f'Delete error: {str(e)}'})
+        }
+    finally:
+        cursor.close()
+        conn.close()
+
+    results = [{'id': deleted_id, 'status': 'deleted'} for deleted_id in deleted_ids]
+    deleted_set = set(deleted_ids)
+    for template_id in dict.fromkeys(template_ids):
+        if template_id in deleted_set:
+            continue
+        status = 'not_matched' if template_id in existing_ids else 'not_found'
+        results.append({'id': template_id, 'status': status})
+
+    return {
+        'statusCode': 200,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*'
+        },
+        'isBase64Encoded': False,
+        'body': json.dumps({
+            'message': f'Deleted {len(deleted_ids)} templates',
+            'deleted': len(deleted_ids),
+            'results': results
+        })
+    }
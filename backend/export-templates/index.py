@@ -0,0 +1,164 @@
+import json
+import os
+import re
+import base64
+import zipfile
+from io import BytesIO
+from typing import Dict, Any, List
+import psycopg2
+
+FETCH_SIZE = 20
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+# The archive is built in memory and returned base64-encoded, so the total
+# size of exported files is capped to fit the function response.
+MAX_EXPORT_BYTES = 3 * 1024 * 1024
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    '''
+    Business: Экспортирует все или выбранные шаблоны в ZIP архив постранично
+    Args: event - dict с httpMethod, queryStringParameters (ids через запятую, limit, offset - опционально)
+          context - object с request_id
+    Returns: HTTP response с ZIP архивом в base64 и manifest.json внутри
+    '''
+    method: str = event.get('httpMethod', 'GET')
+
+    if method == 'OPTIONS':
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Allow-Methods': 'GET, OPTIONS',
+                'Access-Control-Allow-Headers': 'Content-Type',
+                'Access-Control-Max-Age': '86400'
+            },
+            'body': ''
+        }
+
+    if method != 'GET':
+        return {
+            'statusCode': 405,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Method not allowed'})
+        }
+
+    params = event.get('queryStringParameters') or {}
+    ids_param = params.get('ids', '')
+    try:
+        requested_ids = list(dict.fromkeys(int(value) for value in ids_param.split(',') if value.strip()))
+    except ValueError:
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'ids must be a comma-separated list of integers'})
+        }
+
+    try:
+        limit = int(params.get('limit') or DEFAULT_LIMIT)
+        offset = int(params.get('offset') or 0)
+    except ValueError:
+        limit, offset = 0, -1
+    if not 1 <= limit <= MAX_LIMIT or offset < 0:
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'limit must be between 1 and {MAX_LIMIT}, offset must be non-negative'})
+        }
+
+    try:
+        database_url = os.environ.get('DATABASE_URL')
+        if not database_url:
+            return {
+                'statusCode': 500,
+                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'Database connection not configured'})
+            }
+
+        conn = psycopg2.connect(database_url)
+        try:
+            cursor = conn.cursor()
+            if requested_ids:
+                query = "SELECT id, name, LENGTH(file_content) FROM templates WHERE id = ANY(%s) ORDER BY id"
+                cursor.execute(query, (requested_ids,))
+            else:
+                query = "SELECT id, name, LENGTH(file_content) FROM templates ORDER BY id"
+                cursor.execute(query)
+            templates = cursor.fetchall()
+            cursor.close()
+
+            found_ids = {template_id for template_id, _, _ in templates}
+            missing = [{'id': template_id, 'status': 'not_found'} for template_id in requested_ids if template_id not in found_ids]
+
+            if requested_ids and not templates:
+                return {
+                    'statusCode': 404,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'error': 'Templates not found', 'results': missing})
+                }
+
+            # Fill the page up to MAX_EXPORT_BYTES; the rest is left for nextOffset.
+            # A template that alone exceeds the limit is skipped so it never blocks paging.
+            page_end = min(offset + limit, len(templates))
+            names: Dict[int, str] = {}
+            skipped: List[Dict[str, Any]] = []
+            total_size = 0
+            for index in range(offset, page_end):
+                template_id, name, file_size = templates[index]
+                if file_size > MAX_EXPORT_BYTES:
+                    skipped.append({'id': template_id, 'name': name, 'fileSize': file_size, 'status': 'too_large'})
+                    continue
+                if total_size + file_size > MAX_EXPORT_BYTES:
+                    page_end = index
+                    break
+                names[template_id] = name
+                total_size += file_size
+            next_offset = page_end if page_end < len(templates) else None
+
+            content_cursor = None
+            if names:
+                content_cursor = conn.cursor(name='export_templates')
+                content_cursor.itersize = FETCH_SIZE
+                content_cursor.execute(
+                    "SELECT id, file_content FROM templates WHERE id = ANY(%s) ORDER BY id",
+                    (list(names),)
+                )
+
+            buffer = BytesIO()
+            results: List[Dict[str, Any]] = []
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+                for template_id, file_content in (content_cursor if content_cursor is not None else []):
+                    name = names.pop(template_id)
+                    safe_name = re.sub(r'[\\/:*?"<>|\s]+', '_', name).strip('_') or 'template'
+                    file_name = f'{template_id}_{safe_name}.docx'
+                    archive.writestr(file_name, bytes(file_content))
+                    results.append({'id': template_id, 'name': name, 'file': file_name, 'status': 'exported'})
+                if content_cursor is not None:
+                    content_cursor.close()
+
+                results.extend({'id': template_id, 'status': 'not_found'} for template_id in names)
+                archive.writestr('manifest.json', json.dumps({
+                    'results': results + skipped + missing,
+                    'nextOffset': next_offset
+                }, ensure_ascii=False, indent=2))
+        finally:
+            conn.close()
+
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Content-Type': 'application/zip',
+                'Content-Disposition': 'attachment; filename="templates.zip"',
+                'X-Next-Offset': '' if next_offset is None else str(next_offset),
+                'Access-Control-Expose-Headers': 'X-Next-Offset',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'isBase64Encoded': True,
+            'body': base64.b64encode(buffer.getvalue()).decode('utf-8')
+        }
+
+    except Exception as e:
+        return {
+            'statusCode': 500,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'Export error: {str(e)}'})
+        }
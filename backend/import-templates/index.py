@@ -0,0 +1,184 @@
+import json
+import os
+import base64
+import zipfile
+from io import BytesIO
+from typing import Dict, Any, List, Tuple
+import psycopg2
+from psycopg2.extras import execute_values
+
+BATCH_SIZE = 50
+MAX_ENTRIES = 200
+MAX_FILE_BYTES = 10 * 1024 * 1024
+MAX_TOTAL_BYTES = 50 * 1024 * 1024
+UTF8_NAME_FLAG = 0x800
+
+def decode_entry_name(entry: zipfile.ZipInfo) -> str:
+    '''Восстанавливает кириллицу в именах без UTF-8 флага (архивы Windows пишут их в cp866)'''
+    if entry.flag_bits & UTF8_NAME_FLAG:
+        return entry.filename
+    try:
+        return entry.filename.encode('cp437').decode('cp866')
+    except UnicodeError:
+        return entry.filename
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    '''
+    Business: Массово импортирует DOCX шаблоны из ZIP архива в одной транзакции
+    Args: event - dict с httpMethod, body (archive - ZIP архив в base64)
+          context - object с request_id
+    Returns: HTTP response с результатом по каждому файлу архива
+    '''
+    method: str = event.get('httpMethod', 'GET')
+
+    if method == 'OPTIONS':
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Allow-Methods': 'POST, OPTIONS',
+                'Access-Control-Allow-Headers': 'Content-Type',
+                'Access-Control-Max-Age': '86400'
+            },
+            'body': ''
+        }
+
+    if method != 'POST':
+        return {
+            'statusCode': 405,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Method not allowed'})
+        }
+
+    try:
+        body_data = json.loads(event.get('body') or '{}')
+        archive_content = body_data.get('archive', '')
+
+        if not archive_content:
+            return {
+                'statusCode': 400,
+                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'Archive is required'})
+            }
+
+        try:
+            if not isinstance(archive_content, str):
+                raise ValueError('Archive must be a base64 string')
+            archive = zipfile.ZipFile(BytesIO(base64.b64decode(archive_content, validate=True)))
+        except (ValueError, zipfile.BadZipFile):
+            return {
+                'statusCode': 400,
+                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'Archive must be a ZIP file'})
+            }
+
+        results: List[Dict[str, Any]] = []
+        rows: List[Tuple[str, Any]] = []
+        row_results: List[Dict[str, Any]] = []
+        total_bytes = 0
+
+        with archive:
+            entries = [entry for entry in archive.infolist() if not entry.is_dir()]
+            if len(entries) > MAX_ENTRIES:
+                return {
+                    'statusCode': 400,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'error': f'Archive must contain at most {MAX_ENTRIES} files'})
+                }
+
+            for entry in entries:
+                entry_name = decode_entry_name(entry)
+                file_name = os.path.basename(entry_name)
+                if not file_name.lower().endswith('.docx') or file_name.startswith('~$'):
+                    results.append({'file': entry_name, 'status': 'skipped', 'error': 'Not a DOCX file'})
+                    continue
+
+                # file_size is the uncompressed size from the ZIP header; reads
+                # never return more than that, so checking it first bounds memory.
+                if entry.file_size > MAX_FILE_BYTES:
+                    results.append({'file': entry_name, 'status': 'failed', 'error': 'File is too large'})
+                    continue
+                if total_bytes + entry.file_size > MAX_TOTAL_BYTES:
+                    results.append({'file': entry_name, 'status': 'failed', 'error': 'Archive size limit exceeded'})
+                    continue
+
+                file_bytes = archive.read(entry)
+                try:
+                    with zipfile.ZipFile(BytesIO(file_bytes)) as docx:
+                        is_docx = 'word/document.xml' in docx.namelist()
+                except zipfile.BadZipFile:
+                    is_docx = False
+                if not is_docx:
+                    results.append({'file': entry_name, 'status': 'failed', 'error': 'Invalid DOCX file'})
+                    continue
+
+                total_bytes += len(file_bytes)
+                name = file_name[:-len('.docx')][:255] or 'Шаблон заседания'
+                rows.append((name, psycopg2.Binary(file_bytes)))
+                result = {'file': entry_name, 'name': name, 'status': 'imported'}
+                row_results.append(result)
+                results.append(result)
+
+        if not rows:
+            return {
+                'statusCode': 400,
+                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'No DOCX files found in archive', 'results': results}, ensure_ascii=False)
+            }
+
+        database_url = os.environ.get('DATABASE_URL')
+        if not database_url:
+            return {
+                'statusCode': 500,
+                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'Database connection not configured'})
+            }
+
+        conn = psycopg2.connect(database_url)
+        cursor = conn.cursor()
+
+        query = """
+            INSERT INTO templates (name, file_content, created_at, updated_at)
+            VALUES %s
+            RETURNING id
+        """
+        try:
+            ids = []
+            for start in range(0, len(rows), BATCH_SIZE):
+                batch = rows[start:start + BATCH_SIZE]
+                ids.extend(row[0] for row in execute_values(
+                    cursor,
+                    query,
+                    batch,
+                    template='(%s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)',
+                    page_size=len(batch),
+                    fetch=True
+                ))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        for result, result_id in zip(row_results, ids):
+            result['id'] = result_id
+
+        return {
+            'statusCode': 200,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'isBase64Encoded': False,
+            'body': json.dumps({
+                'success': True,
+                'imported': len(ids),
+                'results': results
+            }, ensure_ascii=False)
+        }
+
+    except Exception as e:
+        return {
+            'statusCode': 500,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'Import error: {str(e)}'})
+        }